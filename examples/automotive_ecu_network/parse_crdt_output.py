@@ -8,16 +8,94 @@ simulation and converts values to human-readable units.
 
 import sys
 import re
+import argparse
+import functools
 import struct
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Sentinels delimiting the dump; located with plain substring search
+_CRDT_DUMP_START = '=== CRDT State Dump ==='
+_CRDT_DUMP_END = '=== End CRDT State Dump ==='
+
+# Patterns are compiled once at import time rather than on every parse.
+# ECU headers (_ECU_HEADER_RE, below the schema) split the dump into per-ECU
+# blocks; each block is then a flat list of "Label: 0x..." fields, so the
+# dump is scanned in a single pass.
+# Labels are capitalised words, so most positions fail on their first
+# character instead of backtracking through a lazy \w run.
+# Dumps are plain ASCII, so re.ASCII keeps \s to 8-bit tables.
+_FIELD_RE = re.compile(r'([A-Z][A-Za-z ]*):\s*(0x[0-9A-Fa-f]+)', re.ASCII)
+
+_NO_DATA_MESSAGE = "No CRDT state data found in input"
+
+# Fields expected in each ECU block: (dump label, dict key, 'f' float / 'i' int).
+_ECU_SCHEMA = {
+    'Engine ECU': (
+        ('Temperature', 'temperature', 'f'),
+        ('Error Count', 'error_count', 'i'),
+        ('Config Time', 'config_time', 'i'),
+        ('CAN Buffer', 'can_buffer', 'i'),
+    ),
+    'Brake ECU': (
+        ('Temperature', 'temperature', 'f'),
+        ('Error Count', 'error_count', 'i'),
+        ('Emergency State', 'emergency_state', 'i'),
+        ('Emergency Flag', 'emergency_flag', 'i'),
+    ),
+    'Steering ECU': (
+        ('Temperature', 'temperature', 'f'),
+        ('Error Count', 'error_count', 'i'),
+        ('CAN Buffer', 'can_buffer', 'i'),
+    ),
+    'Gateway ECU': (
+        ('Temperature', 'temperature', 'f'),
+        ('Health Score', 'health_score', 'i'),
+        ('Routing Count', 'routing_count', 'i'),
+        ('CAN Buffer', 'can_buffer', 'i'),
+    ),
+}
+
+# Both header scans match the schema's ECU names, so they cannot diverge:
+# the regex is the default, and the optional hyperscan database locates all
+# headers in one multi-pattern DFA scan once enable_hyperscan() opts in
+_ECU_NAMES = tuple(_ECU_SCHEMA)
+_ECU_HEADER_RE = re.compile(f"({'|'.join(map(re.escape, _ECU_NAMES))}):", re.ASCII)
+_ECU_HEADER_DB = None
+
+# Struct formats for the IEEE 754 bitcast, parsed once at import time
+_PACK_I = struct.Struct('>I').pack
+_UNPACK_F = struct.Struct('>f').unpack
+_PACK_F = struct.Struct('>f').pack
+_UNPACK_I = struct.Struct('>I').unpack
+_PACK_Q = struct.Struct('>Q').pack
+_UNPACK_D = struct.Struct('>d').unpack
+_PACK_D = struct.Struct('>d').pack
+_UNPACK_Q = struct.Struct('>Q').unpack
+
+# Dumps repeat many values across frames (idle sensors, zeroed counters), so
+# the scalar converters memoise recent inputs
+@functools.lru_cache(maxsize=2048)
 def hex_to_float(hex_str):
     """Convert IEEE 754 hex string to float"""
     try:
-        hex_int = int(hex_str, 16)
-        return struct.unpack('!f', struct.pack('!I', hex_int))[0]
+        word = int(hex_str, 16)
+        value = _UNPACK_F(_PACK_I(word))[0]
     except (ValueError, struct.error):
         return None
+    if value != value:
+        # Widening to a double sets a signalling NaN's quiet bit; build the
+        # double from the word's own sign and payload so float_to_hex can
+        # give back the exact word
+        value = _UNPACK_D(_PACK_Q(
+            (word & 0x80000000) << 32 | 0x7FF0000000000000 | (word & 0x007FFFFF) << 29
+        ))[0]
+    return value
 
+@functools.lru_cache(maxsize=2048)
 def hex_to_int(hex_str):
     """Convert hex string to integer"""
     try:
@@ -25,147 +103,322 @@ def hex_to_int(hex_str):
     except ValueError:
         return None
 
-def parse_crdt_state(input_text):
-    """Parse CRDT state dump and convert values"""
+def float_to_hex(value):
+    """Convert float to its IEEE 754 hex string"""
+    if value != value:
+        # Narrow NaNs by hand, keeping the payload hex_to_float stored
+        bits = _UNPACK_Q(_PACK_D(value))[0]
+        return f"0x{bits >> 32 & 0x80000000 | 0x7F800000 | bits >> 29 & 0x007FFFFF:08X}"
+    return f"0x{_UNPACK_I(_PACK_F(value))[0]:08X}"
+
+def enable_hyperscan():
+    """Use hyperscan for ECU header scanning; returns False if unavailable"""
+    global _ECU_HEADER_DB
+    if hyperscan is None:
+        return False
+    if _ECU_HEADER_DB is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[f"{name}:".encode('ascii') for name in _ECU_NAMES],
+            ids=list(range(len(_ECU_NAMES))),
+            elements=len(_ECU_NAMES),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_ECU_NAMES),
+        )
+        _ECU_HEADER_DB = db
+    return True
+
+def find_ecu_headers(crdt_section):
+    """Return (ecu_name, start, end) for each ECU header, in text order"""
+    if _ECU_HEADER_DB is not None:
+        try:
+            data = crdt_section.encode('ascii')
+        except UnicodeEncodeError:
+            # Byte offsets would not match str offsets; use the regex scan
+            pass
+        else:
+            headers = []
+            
+            def on_match(pattern_id, start, end, _flags, _context):
+                headers.append((_ECU_NAMES[pattern_id], start, end))
+            
+            # Matches arrive in end-offset order, which is text order since
+            # headers never overlap
+            _ECU_HEADER_DB.scan(data, match_event_handler=on_match)
+            return headers
     
-    # Look for CRDT State Dump section
-    crdt_match = re.search(r'=== CRDT State Dump ===(.*?)=== End CRDT State Dump ===', 
-                          input_text, re.DOTALL)
+    return [
+        (header.group(1), header.start(), header.end())
+        for header in _ECU_HEADER_RE.finditer(crdt_section)
+    ]
+
+def split_ecu_sections(crdt_section):
+    """Split a CRDT dump section into per-ECU {label: hex_str} field dicts"""
+    headers = find_ecu_headers(crdt_section)
+    sections = {}
+    for i, (ecu_name, _, header_end) in enumerate(headers):
+        # Like the original per-ECU search, the first complete block for a
+        # name wins; a repeated header only replaces a block missing fields
+        fields = sections.get(ecu_name)
+        if fields is not None and all(label in fields for label, _, _ in _ECU_SCHEMA[ecu_name]):
+            continue
+        end = headers[i + 1][1] if i + 1 < len(headers) else len(crdt_section)
+        # The last block runs to the end of the section, so later lines can
+        # reuse a label; like the original regex, the value nearest the
+        # header wins
+        fields = {}
+        for label, hex_str in _FIELD_RE.findall(crdt_section, header_end, end):
+            fields.setdefault(label, hex_str)
+        sections[ecu_name] = fields
+    return sections
+
+def parse_ecu(fields, schema):
+    """Convert an ECU's raw {label: hex_str} fields according to its schema"""
+    ecu = {}
+    for label, key, kind in schema:
+        raw = fields.get(label)
+        if raw is None:
+            return None
+        ecu[key] = hex_to_float(raw) if kind == 'f' else hex_to_int(raw)
+    return ecu
+
+def read_crdt_section(lines):
+    """Collect the CRDT dump section from an iterable of lines"""
+    # Only lines between the sentinels are kept, so large logs stream in
+    # constant memory instead of being read whole
+    section = None
+    for line in lines:
+        if section is None:
+            start = line.find(_CRDT_DUMP_START)
+            if start == -1:
+                continue
+            section = []
+            line = line[start + len(_CRDT_DUMP_START):]
+        
+        end = line.find(_CRDT_DUMP_END)
+        if end != -1:
+            section.append(line[:end])
+            return ''.join(section)
+        section.append(line)
     
-    if not crdt_match:
+    return None
+
+def is_emergency_active(brake_data):
+    """Whether a Brake ECU's emergency state or flag is set"""
+    # A missing field reads as clear; any other non-zero value, None
+    # included, reads as set, as in the original check
+    return brake_data.get('emergency_state', 0) != 0 or brake_data.get('emergency_flag', 0) != 0
+
+def extract_crdt_section(input_text):
+    """Return the text between the CRDT dump sentinels, or None if absent"""
+    _, found, rest = input_text.partition(_CRDT_DUMP_START)
+    if not found:
         return None
     
-    crdt_section = crdt_match.group(1)
+    crdt_section, found, _ = rest.partition(_CRDT_DUMP_END)
+    if not found:
+        return None
     
-    # Parse each ECU section
-    ecus = {}
+    return crdt_section
+
+def parse_crdt_state(input_text):
+    """Parse CRDT state dump and convert values"""
     
-    # Engine ECU
-    engine_match = re.search(r'Engine ECU:\s*Temperature:\s*(0x[0-9A-Fa-f]+)\s*Error Count:\s*(0x[0-9A-Fa-f]+)\s*Config Time:\s*(0x[0-9A-Fa-f]+)\s*CAN Buffer:\s*(0x[0-9A-Fa-f]+)', crdt_section)
-    if engine_match:
-        temp = hex_to_float(engine_match.group(1))
-        error_count = hex_to_int(engine_match.group(2))
-        config_time = hex_to_int(engine_match.group(3))
-        can_buffer = hex_to_int(engine_match.group(4))
-        
-        ecus['Engine ECU'] = {
-            'temperature': temp,
-            'error_count': error_count,
-            'config_time': config_time,
-            'can_buffer': can_buffer,
-            'raw': {
-                'temperature': engine_match.group(1),
-                'error_count': engine_match.group(2),
-                'config_time': engine_match.group(3),
-                'can_buffer': engine_match.group(4)
-            }
-        }
-    
-    # Brake ECU
-    brake_match = re.search(r'Brake ECU:\s*Temperature:\s*(0x[0-9A-Fa-f]+)\s*Error Count:\s*(0x[0-9A-Fa-f]+)\s*Emergency State:\s*(0x[0-9A-Fa-f]+)\s*Emergency Flag:\s*(0x[0-9A-Fa-f]+)', crdt_section)
-    if brake_match:
-        temp = hex_to_float(brake_match.group(1))
-        error_count = hex_to_int(brake_match.group(2))
-        emergency_state = hex_to_int(brake_match.group(3))
-        emergency_flag = hex_to_int(brake_match.group(4))
-        
-        ecus['Brake ECU'] = {
-            'temperature': temp,
-            'error_count': error_count,
-            'emergency_state': emergency_state,
-            'emergency_flag': emergency_flag,
-            'raw': {
-                'temperature': brake_match.group(1),
-                'error_count': brake_match.group(2),
-                'emergency_state': brake_match.group(3),
-                'emergency_flag': brake_match.group(4)
-            }
-        }
-    
-    # Steering ECU
-    steering_match = re.search(r'Steering ECU:\s*Temperature:\s*(0x[0-9A-Fa-f]+)\s*Error Count:\s*(0x[0-9A-Fa-f]+)\s*CAN Buffer:\s*(0x[0-9A-Fa-f]+)', crdt_section)
-    if steering_match:
-        temp = hex_to_float(steering_match.group(1))
-        error_count = hex_to_int(steering_match.group(2))
-        can_buffer = hex_to_int(steering_match.group(3))
-        
-        ecus['Steering ECU'] = {
-            'temperature': temp,
-            'error_count': error_count,
-            'can_buffer': can_buffer,
-            'raw': {
-                'temperature': steering_match.group(1),
-                'error_count': steering_match.group(2),
-                'can_buffer': steering_match.group(3)
-            }
-        }
-    
-    # Gateway ECU
-    gateway_match = re.search(r'Gateway ECU:\s*Temperature:\s*(0x[0-9A-Fa-f]+)\s*Health Score:\s*(0x[0-9A-Fa-f]+)\s*Routing Count:\s*(0x[0-9A-Fa-f]+)\s*CAN Buffer:\s*(0x[0-9A-Fa-f]+)', crdt_section)
-    if gateway_match:
-        temp = hex_to_float(gateway_match.group(1))
-        health_score = hex_to_int(gateway_match.group(2))
-        routing_count = hex_to_int(gateway_match.group(3))
-        can_buffer = hex_to_int(gateway_match.group(4))
-        
-        ecus['Gateway ECU'] = {
-            'temperature': temp,
-            'health_score': health_score,
-            'routing_count': routing_count,
-            'can_buffer': can_buffer,
-            'raw': {
-                'temperature': gateway_match.group(1),
-                'health_score': gateway_match.group(2),
-                'routing_count': gateway_match.group(3),
-                'can_buffer': gateway_match.group(4)
-            }
-        }
-    
-    return ecus
-
-def format_output(ecus):
-    """Format the parsed ECU data for display"""
-    if not ecus:
-        return "No CRDT state data found in input"
+    # Look for CRDT State Dump section
+    crdt_section = extract_crdt_section(input_text)
+    if crdt_section is None:
+        return None
     
+    return parse_crdt_section(crdt_section)
+
+def iter_ecus(crdt_section):
+    """Yield (ecu_name, data) for each complete ECU block, in schema order"""
+    sections = split_ecu_sections(crdt_section)
+    for ecu_name, schema in _ECU_SCHEMA.items():
+        fields = sections.get(ecu_name)
+        if fields is None:
+            continue
+        data = parse_ecu(fields, schema)
+        if data is not None:
+            yield ecu_name, data
+
+def parse_crdt_section(crdt_section):
+    """Parse the body of a CRDT state dump (between the sentinels)"""
+    return dict(iter_ecus(crdt_section))
+
+def format_celsius(temp_c):
+    """Format a temperature in Celsius with its Fahrenheit equivalent"""
+    return f"{temp_c:6.2f}°C ({temp_c * 1.8 + 32:6.2f}°F)"
+
+def format_word(value):
+    """Format an integer as a 32-bit hex word"""
+    return f"0x{value:08X}"
+
+# Report lines in display order: dict key -> (label, shown value, raw hex word)
+_FIELD_DISPLAY = {
+    'temperature': ('Temperature', format_celsius, float_to_hex),
+    'error_count': ('Error Count', '{:,}'.format, format_word),
+    'emergency_state': ('Emergency', lambda value: "ACTIVE" if value != 0 else "INACTIVE", format_word),
+    'emergency_flag': ('Emergency Flag', lambda value: "SET" if value != 0 else "CLEAR", format_word),
+    'health_score': ('Health Score', '{:,}'.format, format_word),
+    'routing_count': ('Routing Count', '{:,}'.format, format_word),
+    'config_time': ('Config Time', '{:,}'.format, format_word),
+    'can_buffer': ('CAN Buffer', '{:,}'.format, format_word),
+}
+
+# Label columns are padded once here rather than on every report line
+_FIELD_LINES = tuple(
+    (key, f"  {label + ':':<16}", show, raw_hex)
+    for key, (label, show, raw_hex) in _FIELD_DISPLAY.items()
+)
+
+def format_ecu(ecu_name, data, verbose=False):
+    """Format one ECU block field by field, with raw hex words if verbose"""
+    lines = [f"\n{ecu_name}:", "-" * (len(ecu_name) + 1)]
+    for key, prefix, show, raw_hex in _FIELD_LINES:
+        # Unknown ECUs and partial or caller-built dicts show whichever
+        # known fields they have, like the original per-field checks
+        value = data.get(key)
+        if value is None:
+            continue
+        if verbose:
+            lines.append(f"{prefix}{show(value)} [{raw_hex(value)}]")
+        else:
+            lines.append(prefix + show(value))
+    return "\n".join(lines)
+
+# Per-ECU templates for complete blocks: one f-string each, in the layout
+# format_ecu builds from _FIELD_DISPLAY (test_scenarios.sh parser checks
+# that the two agree)
+def format_engine(data):
+    """Format a complete Engine ECU block"""
+    return f"""
+Engine ECU:
+-----------
+  Temperature:    {format_celsius(data['temperature'])}
+  Error Count:    {data['error_count']:,}
+  Config Time:    {data['config_time']:,}
+  CAN Buffer:     {data['can_buffer']:,}"""
+
+def format_engine_verbose(data):
+    """Format a complete Engine ECU block with raw hex words"""
+    temperature = data['temperature']
+    error_count = data['error_count']
+    config_time = data['config_time']
+    can_buffer = data['can_buffer']
+    return f"""
+Engine ECU:
+-----------
+  Temperature:    {format_celsius(temperature)} [{float_to_hex(temperature)}]
+  Error Count:    {error_count:,} [0x{error_count:08X}]
+  Config Time:    {config_time:,} [0x{config_time:08X}]
+  CAN Buffer:     {can_buffer:,} [0x{can_buffer:08X}]"""
+
+def format_brake(data):
+    """Format a complete Brake ECU block"""
+    return f"""
+Brake ECU:
+----------
+  Temperature:    {format_celsius(data['temperature'])}
+  Error Count:    {data['error_count']:,}
+  Emergency:      {"ACTIVE" if data['emergency_state'] != 0 else "INACTIVE"}
+  Emergency Flag: {"SET" if data['emergency_flag'] != 0 else "CLEAR"}"""
+
+def format_brake_verbose(data):
+    """Format a complete Brake ECU block with raw hex words"""
+    temperature = data['temperature']
+    error_count = data['error_count']
+    emergency_state = data['emergency_state']
+    emergency_flag = data['emergency_flag']
+    return f"""
+Brake ECU:
+----------
+  Temperature:    {format_celsius(temperature)} [{float_to_hex(temperature)}]
+  Error Count:    {error_count:,} [0x{error_count:08X}]
+  Emergency:      {"ACTIVE" if emergency_state != 0 else "INACTIVE"} [0x{emergency_state:08X}]
+  Emergency Flag: {"SET" if emergency_flag != 0 else "CLEAR"} [0x{emergency_flag:08X}]"""
+
+def format_steering(data):
+    """Format a complete Steering ECU block"""
+    return f"""
+Steering ECU:
+-------------
+  Temperature:    {format_celsius(data['temperature'])}
+  Error Count:    {data['error_count']:,}
+  CAN Buffer:     {data['can_buffer']:,}"""
+
+def format_steering_verbose(data):
+    """Format a complete Steering ECU block with raw hex words"""
+    temperature = data['temperature']
+    error_count = data['error_count']
+    can_buffer = data['can_buffer']
+    return f"""
+Steering ECU:
+-------------
+  Temperature:    {format_celsius(temperature)} [{float_to_hex(temperature)}]
+  Error Count:    {error_count:,} [0x{error_count:08X}]
+  CAN Buffer:     {can_buffer:,} [0x{can_buffer:08X}]"""
+
+def format_gateway(data):
+    """Format a complete Gateway ECU block"""
+    return f"""
+Gateway ECU:
+------------
+  Temperature:    {format_celsius(data['temperature'])}
+  Health Score:   {data['health_score']:,}
+  Routing Count:  {data['routing_count']:,}
+  CAN Buffer:     {data['can_buffer']:,}"""
+
+def format_gateway_verbose(data):
+    """Format a complete Gateway ECU block with raw hex words"""
+    temperature = data['temperature']
+    health_score = data['health_score']
+    routing_count = data['routing_count']
+    can_buffer = data['can_buffer']
+    return f"""
+Gateway ECU:
+------------
+  Temperature:    {format_celsius(temperature)} [{float_to_hex(temperature)}]
+  Health Score:   {health_score:,} [0x{health_score:08X}]
+  Routing Count:  {routing_count:,} [0x{routing_count:08X}]
+  CAN Buffer:     {can_buffer:,} [0x{can_buffer:08X}]"""
+
+# Each report picks one table up front, so the verbose flag is not
+# re-checked per ECU or per line; _ECU_KEYS lists the fields a template reads
+_ECU_TEMPLATES = {
+    'Engine ECU': format_engine,
+    'Brake ECU': format_brake,
+    'Steering ECU': format_steering,
+    'Gateway ECU': format_gateway,
+}
+_ECU_TEMPLATES_VERBOSE = {
+    'Engine ECU': format_engine_verbose,
+    'Brake ECU': format_brake_verbose,
+    'Steering ECU': format_steering_verbose,
+    'Gateway ECU': format_gateway_verbose,
+}
+_ECU_KEYS = {
+    ecu_name: tuple(key for _, key, _ in schema) for ecu_name, schema in _ECU_SCHEMA.items()
+}
+
+def temperature_stats(temps):
+    """Return (min, max, mean) of a non-empty sequence in a single pass"""
+    it = iter(temps)
+    lo = hi = total = next(it)
+    for temp in it:
+        if temp < lo:
+            lo = temp
+        elif temp > hi:
+            hi = temp
+        total += temp
+    return lo, hi, total / len(temps)
+
+def format_report(blocks, temps, emergency_active):
+    """Assemble formatted ECU blocks and the system analysis summary"""
     output = []
     output.append("=" * 60)
     output.append("CRDT STATE ANALYSIS")
     output.append("=" * 60)
-    
-    for ecu_name, data in ecus.items():
-        output.append(f"\n{ecu_name}:")
-        output.append("-" * (len(ecu_name) + 1))
-        
-        # Temperature (always present)
-        if data['temperature'] is not None:
-            temp_c = data['temperature']
-            temp_f = temp_c * 9/5 + 32
-            output.append(f"  Temperature:    {temp_c:6.2f}°C ({temp_f:6.2f}°F) [{data['raw']['temperature']}]")
-        
-        # ECU-specific fields
-        if 'error_count' in data:
-            output.append(f"  Error Count:    {data['error_count']:,} [{data['raw']['error_count']}]")
-        
-        if 'emergency_state' in data:
-            emergency_active = "ACTIVE" if data['emergency_state'] != 0 else "INACTIVE"
-            output.append(f"  Emergency:      {emergency_active} [{data['raw']['emergency_state']}]")
-            
-        if 'emergency_flag' in data:
-            flag_status = "SET" if data['emergency_flag'] != 0 else "CLEAR"
-            output.append(f"  Emergency Flag: {flag_status} [{data['raw']['emergency_flag']}]")
-        
-        if 'health_score' in data:
-            output.append(f"  Health Score:   {data['health_score']:,} [{data['raw']['health_score']}]")
-            
-        if 'routing_count' in data:
-            output.append(f"  Routing Count:  {data['routing_count']:,} [{data['raw']['routing_count']}]")
-        
-        if 'config_time' in data:
-            output.append(f"  Config Time:    {data['config_time']:,} [{data['raw']['config_time']}]")
-        
-        if 'can_buffer' in data:
-            output.append(f"  CAN Buffer:     {data['can_buffer']:,} [{data['raw']['can_buffer']}]")
+    output.extend(blocks)
     
     # Summary analysis
     output.append("\n" + "=" * 60)
@@ -173,11 +426,8 @@ def format_output(ecus):
     output.append("=" * 60)
     
     # Temperature analysis
-    temps = [data['temperature'] for data in ecus.values() if data['temperature'] is not None]
     if temps:
-        avg_temp = sum(temps) / len(temps)
-        max_temp = max(temps)
-        min_temp = min(temps)
+        min_temp, max_temp, avg_temp = temperature_stats(temps)
         
         output.append(f"Average Temperature: {avg_temp:.2f}°C")
         output.append(f"Temperature Range:   {min_temp:.2f}°C - {max_temp:.2f}°C")
@@ -189,12 +439,6 @@ def format_output(ecus):
             output.append("🚨 CRITICAL: Overheating condition!")
     
     # Emergency status
-    emergency_active = False
-    if 'Brake ECU' in ecus:
-        brake_data = ecus['Brake ECU']
-        if brake_data.get('emergency_state', 0) != 0 or brake_data.get('emergency_flag', 0) != 0:
-            emergency_active = True
-    
     if emergency_active:
         output.append("🚨 EMERGENCY: Emergency braking system active!")
     else:
@@ -202,26 +446,62 @@ def format_output(ecus):
     
     return "\n".join(output)
 
+def format_output(ecus, verbose=False):
+    """Format the parsed ECU data for display, with raw hex words if verbose"""
+    if not ecus:
+        return _NO_DATA_MESSAGE
+    
+    templates = _ECU_TEMPLATES_VERBOSE if verbose else _ECU_TEMPLATES
+    blocks = []
+    temps = []
+    emergency_active = False
+    for ecu_name, data in ecus.items():
+        # Templates need every schema field present and not None; anything
+        # else goes field by field
+        keys = _ECU_KEYS.get(ecu_name)
+        if keys is not None and None not in map(data.get, keys):
+            blocks.append(templates[ecu_name](data))
+        else:
+            blocks.append(format_ecu(ecu_name, data, verbose))
+        temp = data.get('temperature')
+        if temp is not None:
+            temps.append(temp)
+        if ecu_name == 'Brake ECU':
+            emergency_active = is_emergency_active(data)
+    
+    return format_report(blocks, temps, emergency_active)
+
 def main():
     """Main function"""
-    if len(sys.argv) > 1:
+    parser = argparse.ArgumentParser(description="Parse a CRDT state dump and convert values to human-readable units")
+    parser.add_argument('logfile', nargs='?', help="simulation log to parse (default: stdin)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="annotate every value with its raw [0x...] hex word")
+    parser.add_argument('--hyperscan', action='store_true',
+                        help="locate ECU headers with hyperscan (must be installed)")
+    args = parser.parse_args()
+    
+    if args.hyperscan and not enable_hyperscan():
+        print("Error: --hyperscan requested but the hyperscan module is not installed", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.logfile:
         # Read from file
         try:
-            with open(sys.argv[1], 'r') as f:
-                input_text = f.read()
+            with open(args.logfile, 'r') as f:
+                crdt_section = read_crdt_section(f)
         except FileNotFoundError:
-            print(f"Error: File '{sys.argv[1]}' not found", file=sys.stderr)
+            print(f"Error: File '{args.logfile}' not found", file=sys.stderr)
             sys.exit(1)
     else:
         # Read from stdin
-        input_text = sys.stdin.read()
+        crdt_section = read_crdt_section(sys.stdin)
     
     # Parse the CRDT state
-    ecus = parse_crdt_state(input_text)
+    ecus = parse_crdt_section(crdt_section) if crdt_section is not None else None
     
     # Format and print output
-    result = format_output(ecus)
-    print(result)
+    print(format_output(ecus, args.verbose))
     
     # Exit with appropriate code
     if ecus: